@@ -7,8 +7,158 @@ import cv2
 import mediapipe as mp
 import numpy as np
 from typing import Optional, List, Tuple
+import sys
+import threading
 import time
-from collections import deque
+from collections import Counter, deque
+
+
+# Gesture codes returned by the numeric kernels
+GESTURE_NAMES = (None, "point_up", "point_down", "point_left", "point_right",
+                 "thumbs_up", "thumbs_down", "peace", "fist")
+SWIPE_NAMES = (None, "swipe_up", "swipe_down", "swipe_left", "swipe_right")
+
+# Classifier thresholds (normalized landmark units)
+CLASSIFY_TOLERANCE = 0.02  # Slack for finger extension checks
+POINT_THRESHOLD = 0.08  # Minimum index-to-wrist offset for a pointing gesture
+
+
+def _check_mediapipe_build():
+    """Warn if MediaPipe predates builds that run Hands on the XNNPACK delegate"""
+    try:
+        major, minor = (int(part) for part in mp.__version__.split(".")[:2])
+    except (AttributeError, ValueError):
+        return
+    if (major, minor) < (0, 10):
+        print(f"⚠️  MediaPipe {mp.__version__} may not use the XNNPACK delegate - "
+              "upgrade to mediapipe>=0.10 for faster hand tracking")
+
+
+def _classify_gesture_py(lm, tol, thr):
+    """Classify a (21, 3) landmark array; returns an index into GESTURE_NAMES"""
+    # Check if fingers are extended - tip above PIP joint by a small tolerance
+    # Scalar indexing on purpose: it compiles to plain loads under Numba/Cython,
+    # where fancy indexing would allocate temporary arrays
+    index_extended = lm[8, 1] < lm[6, 1] - tol
+    middle_extended = lm[12, 1] < lm[10, 1] - tol
+    ring_extended = lm[16, 1] < lm[14, 1] - tol
+    pinky_extended = lm[20, 1] < lm[18, 1] - tol
+    
+    # Thumb extends outward: right of its IP joint for a right hand, left for a left hand
+    # Use wrist position to determine hand side
+    if lm[2, 0] < lm[0, 0]:
+        thumb_extended = lm[4, 0] > lm[3, 0] + tol
+    else:
+        thumb_extended = lm[4, 0] < lm[3, 0] - tol
+    
+    # Point gestures: Only index finger extended, others closed
+    if index_extended and not middle_extended and not ring_extended and not pinky_extended:
+        # Relative position of index tip to wrist (positive dy = down)
+        dx = lm[8, 0] - lm[0, 0]
+        dy = lm[8, 1] - lm[0, 1]
+        abs_dx = abs(dx)
+        abs_dy = abs(dy)
+        
+        # Require a dominant axis and a clear offset along it
+        if abs_dy > abs_dx * 1.2 and dy < -thr:
+            return 1  # point_up
+        elif abs_dy > abs_dx * 1.2 and dy > thr:
+            return 2  # point_down
+        elif abs_dx > abs_dy * 1.2 and dx < -thr:
+            return 3  # point_left
+        elif abs_dx > abs_dy * 1.2 and dx > thr:
+            return 4  # point_right
+    
+    fingers_closed = (not index_extended and not middle_extended and
+                      not ring_extended and not pinky_extended)
+    
+    # Thumbs up/down: thumb clearly above/below its IP joint, others closed
+    if thumb_extended and fingers_closed:
+        if lm[3, 1] - lm[4, 1] > 0.05:
+            return 5  # thumbs_up
+        if lm[4, 1] - lm[3, 1] > 0.05:
+            return 6  # thumbs_down
+    
+    # Peace sign (V) - can be used for up
+    if index_extended and middle_extended and not ring_extended and not pinky_extended:
+        return 7  # peace
+    
+    # Fist - can be used for down
+    if fingers_closed:
+        return 8  # fist
+    
+    return 0
+
+
+def _detect_swipe_py(dx, dy, dt, dist_thr_sq, speed_thr):
+    """Classify a hand movement; returns an index into SWIPE_NAMES"""
+    if dt <= 0:
+        return 0
+    
+    # Check if movement is significant enough to be a swipe
+    # Compare squared distances to avoid a square root per frame
+    dist_sq = dx * dx + dy * dy
+    min_dist = speed_thr * dt
+    if dist_sq < dist_thr_sq or dist_sq < min_dist * min_dist:
+        return 0
+    
+    # Movement must be primarily in one direction
+    abs_dx = abs(dx)
+    abs_dy = abs(dy)
+    if abs_dy > abs_dx * 1.5:  # Vertical swipe (y increases downward)
+        return 1 if dy < 0 else 2
+    elif abs_dx > abs_dy * 1.5:  # Horizontal swipe
+        return 3 if dx < 0 else 4
+    return 0
+
+
+def _kernels_match(classify, swipe, samples: int = 500) -> bool:
+    """Check a compiled kernel pair against the Python reference on fixed random inputs"""
+    rng = np.random.default_rng(0)
+    for _ in range(samples):
+        lm = rng.uniform(0.3, 0.7, (21, 3)).astype(np.float32)
+        if (classify(lm, CLASSIFY_TOLERANCE, POINT_THRESHOLD) !=
+                _classify_gesture_py(lm, CLASSIFY_TOLERANCE, POINT_THRESHOLD)):
+            return False
+        dx, dy = rng.uniform(-0.2, 0.2, 2)
+        dt = rng.uniform(0.0, 0.5)
+        if swipe(dx, dy, dt, 0.0025, 0.02) != _detect_swipe_py(dx, dy, dt, 0.0025, 0.02):
+            return False
+    return True
+
+
+# Pick the fastest available kernels: compiled Cython extension (build with
+# `python setup.py build_ext --inplace`), then Numba JIT, then plain Python
+try:
+    from gesture_kernels import classify_gesture as _classify_gesture_kernel
+    from gesture_kernels import detect_swipe as _detect_swipe_kernel
+    KERNEL_BACKEND = "cython"
+except ImportError:
+    try:
+        from numba import njit
+    except ImportError:
+        _classify_gesture_kernel = _classify_gesture_py
+        _detect_swipe_kernel = _detect_swipe_py
+        KERNEL_BACKEND = "python"
+    else:
+        # Compiled on first call - the parity check below doubles as warm-up,
+        # so the first camera frame doesn't pay the JIT cost
+        _classify_gesture_kernel = njit(cache=True)(_classify_gesture_py)
+        _detect_swipe_kernel = njit(cache=True)(_detect_swipe_py)
+        KERNEL_BACKEND = "numba"
+
+# A stale gesture_kernels build would silently ignore edits to the Python kernels
+if KERNEL_BACKEND != "python" and not _kernels_match(_classify_gesture_kernel, _detect_swipe_kernel):
+    print(f"⚠️  {KERNEL_BACKEND} gesture kernels disagree with gesture_controller.py - "
+          "rebuild with `python setup.py build_ext --inplace`; using plain Python")
+    _classify_gesture_kernel = _classify_gesture_py
+    _detect_swipe_kernel = _detect_swipe_py
+    KERNEL_BACKEND = "python"
+
+print(f"Gesture kernels: {KERNEL_BACKEND}")
+
+
+_check_mediapipe_build()
 
 
 class GestureController:
@@ -19,6 +169,7 @@ class GestureController:
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
+            model_complexity=0,  # Lite landmark model - plenty for coarse point/swipe gestures
             min_detection_confidence=0.6,  # Lowered for better initial detection
             min_tracking_confidence=0.6  # Increased for more stable tracking
         )
@@ -26,6 +177,35 @@ class GestureController:
         self.camera_index = camera_index
         self.cap = None
         
+        # Capture settings - small frames and a 1-frame driver buffer keep latency low
+        self.frame_width = 320
+        self.frame_height = 240
+        self.camera_fps = 30
+        
+        # Reusable per-frame buffers (allocated on first use, at the processing size)
+        self._small_buf = None
+        self._flip_buf = None
+        self._rgb_buf = None
+        
+        # Background capture - reader thread keeps only the newest frame
+        self._latest = None  # (frame, monotonic timestamp)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reader_thread = None
+        self._new_frame = threading.Event()
+        self._last_frame_time = None
+        
+        # Background detection - publishes gestures for poll_gesture()
+        self._detect_thread = None
+        self._detect_lock = threading.Lock()  # Serializes inference and its cached results
+        self._gesture_lock = threading.Lock()  # Guards the published gestures below
+        self._latest_gesture = None  # Latest static gesture: (gesture, monotonic timestamp)
+        self._swipe_queue: deque = deque(maxlen=2)  # One-shot swipes: (gesture, monotonic timestamp)
+        
+        # Results of the last inference, reused for drawing instead of re-running Hands
+        self._last_frame = None
+        self._last_results = None
+        
         # Swipe detection parameters
         self.use_swipe = use_swipe
         self.position_history: deque = deque(maxlen=10)  # Store last 10 positions
@@ -33,40 +213,183 @@ class GestureController:
         self.swipe_speed_threshold = 0.02  # Minimum speed for swipe
         self.last_swipe_time = 0
         self.swipe_cooldown = 0.3  # Minimum time between swipes (seconds)
+        self.swipe_window = 0.15  # Only compare against positions this recent (seconds)
+        self.swipe_min_samples = 3  # Positions needed to judge a swipe (kept even if older than swipe_window)
         
         # Temporal smoothing for gesture detection
-        self.gesture_history: deque = deque(maxlen=5)  # Store last 5 detected gestures
-        self.gesture_confidence_threshold = 3  # Need 3/5 frames to confirm gesture
+        # Sized for detection at camera rate (~30 FPS): 9/15 frames is ~0.3 s to confirm.
+        # The threshold must stay above half the history length (one confirmed gesture at a time).
+        # When calling detect_gesture() from a slower loop, shrink both to keep the same delay.
+        # swipe_window needs no retuning: pruning always keeps swipe_min_samples positions,
+        # so swipes still register below ~20 FPS (dt just spans those samples instead).
+        self.gesture_history: deque = deque(maxlen=15)  # Store last 15 detected gestures
+        self.gesture_confidence_threshold = 9  # Need 9/15 frames to confirm gesture
+        self._counts: Counter = Counter()  # Running counts of gestures in gesture_history
+        self._smoothed_gesture = None  # Gesture currently at or above the threshold
     
-    def start_camera(self):
-        """Start camera capture"""
-        self.cap = cv2.VideoCapture(self.camera_index)
+    def start_camera(self, background_detection: bool = True):
+        """
+        Start camera capture
+        With background_detection, gestures are detected on a worker thread; read them with poll_gesture()
+        """
+        # Use a backend that honors CAP_PROP_BUFFERSIZE where available
+        if sys.platform.startswith("linux"):
+            self.cap = cv2.VideoCapture(self.camera_index, cv2.CAP_V4L2)
+        elif sys.platform == "win32":
+            self.cap = cv2.VideoCapture(self.camera_index, cv2.CAP_DSHOW)
+        else:
+            self.cap = cv2.VideoCapture(self.camera_index)
+        if not self.cap.isOpened():
+            # Some OpenCV builds/webcams only open under the default backend
+            self.cap.release()
+            self.cap = cv2.VideoCapture(self.camera_index)
         if not self.cap.isOpened():
             raise Exception(f"Could not open camera {self.camera_index}")
+        
+        # Keep only the newest frame in the driver queue so reads are never stale
+        if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("⚠️  Camera backend ignored CAP_PROP_BUFFERSIZE - frames may lag")
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
+        self.cap.set(cv2.CAP_PROP_FPS, self.camera_fps)
+        
+        # Drain the camera continuously so the game tick never reads a queued frame
+        self._stop.clear()
+        self._reader_thread = threading.Thread(target=self._reader, daemon=True)
+        self._reader_thread.start()
+        
+        # Run inference off the game loop so slow frames never stall it
+        if background_detection:
+            self._detect_thread = threading.Thread(target=self._detect_loop, daemon=True)
+            self._detect_thread.start()
         return True
     
-    def detect_gesture(self) -> Optional[str]:
+    def _reader(self):
+        """Continuously read frames, keeping only the latest one"""
+        while not self._stop.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                time.sleep(0.005)
+                continue
+            with self._lock:
+                self._latest = (frame, time.monotonic())
+            self._new_frame.set()
+    
+    def _detect_loop(self):
+        """Detect gestures on each new frame and publish the latest one"""
+        while not self._stop.is_set():
+            if not self._new_frame.wait(timeout=0.1):
+                continue
+            self._new_frame.clear()
+            try:
+                gesture = self.detect_gesture()
+            except Exception as e:
+                print(f"Gesture detection error: {e}")
+                continue
+            if not gesture:
+                continue
+            with self._gesture_lock:
+                # Swipes are reported for a single frame, so queue them rather than
+                # letting the next static gesture overwrite them before the game reads them
+                if gesture in SWIPE_NAMES:
+                    self._swipe_queue.append((gesture, time.monotonic()))
+                    self._latest_gesture = None  # Static pose from before the swipe is stale
+                else:
+                    self._latest_gesture = (gesture, time.monotonic())
+    
+    def poll_gesture(self, max_age: float = 0.2) -> Optional[str]:
+        """
+        Get the next gesture from background detection without blocking
+        Queued swipes take priority over static gestures; each gesture is returned once
+        Returns: gesture name, or None if nothing was detected in the last max_age seconds
+        """
+        now = time.monotonic()
+        with self._gesture_lock:
+            while self._swipe_queue:
+                gesture, detected_at = self._swipe_queue.popleft()
+                if now - detected_at <= max_age:
+                    return gesture
+            
+            latest = self._latest_gesture
+            self._latest_gesture = None
+        
+        if latest is None or now - latest[1] > max_age:
+            return None
+        return latest[0]
+    
+    def _get_latest_frame(self) -> Optional[Tuple[np.ndarray, float]]:
+        """Get the newest captured frame and its timestamp"""
+        with self._lock:
+            return self._latest
+    
+    def _prepare_frame(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Shrink frame to the processing size and mirror it, reusing buffers
+        Landmarks are normalized, so no rescaling is needed downstream
+        """
+        size = (self.frame_height, self.frame_width, 3)
+        if self._flip_buf is None or self._flip_buf.shape != size:
+            self._small_buf = np.empty(size, dtype=np.uint8)
+            self._flip_buf = np.empty(size, dtype=np.uint8)
+            self._rgb_buf = np.empty(size, dtype=np.uint8)
+        
+        if frame.shape != size:
+            frame = cv2.resize(frame, (self.frame_width, self.frame_height),
+                               dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        
+        # Flip frame horizontally for mirror effect
+        cv2.flip(frame, 1, dst=self._flip_buf)
+        return self._flip_buf
+    
+    def detect_gesture(self, draw: bool = False):
         """
         Detect hand gesture from camera (swipe or static gesture)
         Returns: gesture name or None
+        With draw=True returns (gesture, annotated frame or None), reusing the same inference
         """
+        with self._detect_lock:
+            gesture = self._detect_gesture()
+            if not draw:
+                return gesture
+            
+            annotated = None
+            if self._last_frame is not None:
+                annotated = self.draw_landmarks(self._last_frame.copy(), self._last_results)
+            return gesture, annotated
+    
+    def _detect_gesture(self) -> Optional[str]:
+        """Run hand tracking on the newest camera frame and classify it"""
         if self.cap is None:
             return None
         
-        ret, frame = self.cap.read()
-        if not ret:
+        latest = self._get_latest_frame()
+        if latest is None:
             return None
         
-        # Flip frame horizontally for mirror effect
-        frame = cv2.flip(frame, 1)
+        frame, frame_time = latest
+        # Skip inference if no new frame arrived since last call
+        if frame_time == self._last_frame_time:
+            return None
+        self._last_frame_time = frame_time
+        
+        frame = self._prepare_frame(frame)
         
         # Convert to RGB
-        rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_image)
+        rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        
+        # Read-only input lets MediaPipe use the buffer without copying it
+        rgb_image.flags.writeable = False
+        try:
+            results = self.hands.process(rgb_image)
+        finally:
+            # Restore even on failure, or the next cvtColor into this buffer fails
+            rgb_image.flags.writeable = True
+        self._last_frame = frame
+        self._last_results = results
         
         if not results.multi_hand_landmarks:
             self.position_history.clear()  # Clear history if hand not detected
-            self.gesture_history.clear()  # Clear gesture history too
+            self._clear_gesture_history()  # Clear gesture history too
             return None
         
         hand_landmarks = results.multi_hand_landmarks[0]
@@ -74,7 +397,7 @@ class GestureController:
         # Get current hand position (using wrist or index finger tip)
         wrist = hand_landmarks.landmark[0]
         current_pos = (wrist.x, wrist.y)
-        current_time = time.time()
+        current_time = frame_time
         
         # Detect swipe first (if enabled)
         # Swipes are quick intentional movements, so they bypass smoothing
@@ -82,36 +405,34 @@ class GestureController:
             swipe_gesture = self._detect_swipe(current_pos, current_time)
             if swipe_gesture:
                 # Clear gesture history when swipe detected (swipe takes priority)
-                self.gesture_history.clear()
+                self._clear_gesture_history()
                 return swipe_gesture
         
         # Store current position for swipe tracking
         self.position_history.append((current_pos, current_time))
         
         # Extract key points for static gesture detection
-        landmarks = []
-        for landmark in hand_landmarks.landmark:
-            landmarks.append([landmark.x, landmark.y, landmark.z])
-        landmarks = np.array(landmarks)
+        landmarks = np.array([[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark],
+                             dtype=np.float32)
         
         # Detect static gesture (fallback)
         gesture = self._classify_gesture(landmarks)
         
-        # Apply temporal smoothing
-        if gesture:
-            self.gesture_history.append(gesture)
-        else:
-            self.gesture_history.append(None)
-        
-        # Return gesture only if it appears consistently
-        return self._get_smoothed_gesture()
+        # Apply temporal smoothing - return gesture only if it appears consistently
+        return self._get_smoothed_gesture(gesture)
     
     def _detect_swipe(self, current_pos: Tuple[float, float], current_time: float) -> Optional[str]:
         """
         Detect swipe gesture based on hand movement
         Returns: swipe direction or None
         """
-        if len(self.position_history) < 3:
+        # Drop stale positions so a paused hand can't trigger a swipe later, but never
+        # below the sample minimum - at low detection rates that would rule out swipes
+        while (len(self.position_history) > self.swipe_min_samples and
+               current_time - self.position_history[0][1] > self.swipe_window):
+            self.position_history.popleft()
+        
+        if len(self.position_history) < self.swipe_min_samples:
             return None
         
         # Check cooldown
@@ -120,182 +441,66 @@ class GestureController:
         
         # Get positions from history
         old_pos, old_time = self.position_history[0]
-        new_pos = current_pos
         
         # Calculate movement
-        dx = new_pos[0] - old_pos[0]  # Horizontal movement
-        dy = new_pos[1] - old_pos[1]  # Vertical movement (note: y increases downward)
+        dx = current_pos[0] - old_pos[0]  # Horizontal movement
+        dy = current_pos[1] - old_pos[1]  # Vertical movement (note: y increases downward)
         dt = current_time - old_time
         
-        # Calculate distance and speed
-        distance = np.sqrt(dx**2 + dy**2)
-        speed = distance / dt if dt > 0 else 0
-        
-        # Check if movement is significant enough to be a swipe
-        if distance < self.swipe_threshold or speed < self.swipe_speed_threshold:
+        # Square the threshold here so changes to swipe_threshold take effect immediately
+        code = _detect_swipe_kernel(dx, dy, dt, self.swipe_threshold ** 2,
+                                    self.swipe_speed_threshold)
+        if code == 0:
             return None
         
-        # Determine swipe direction
-        # Use absolute values to find dominant direction
-        abs_dx = abs(dx)
-        abs_dy = abs(dy)
-        
-        # Check if movement is primarily in one direction
-        if abs_dy > abs_dx * 1.5:  # Vertical swipe
-            if dy < 0:  # Moving up (y decreases upward)
-                self.last_swipe_time = current_time
-                return "swipe_up"
-            else:  # Moving down (y increases downward)
-                self.last_swipe_time = current_time
-                return "swipe_down"
-        elif abs_dx > abs_dy * 1.5:  # Horizontal swipe
-            if dx < 0:  # Moving left (x decreases leftward)
-                self.last_swipe_time = current_time
-                return "swipe_left"
-            else:  # Moving right (x increases rightward)
-                self.last_swipe_time = current_time
-                return "swipe_right"
-        
-        return None
+        self.last_swipe_time = current_time
+        return SWIPE_NAMES[code]
     
-    def _get_smoothed_gesture(self) -> Optional[str]:
+    def _get_smoothed_gesture(self, gesture: Optional[str]) -> Optional[str]:
         """
         Apply temporal smoothing to reduce false positives
-        Returns gesture only if it appears consistently in recent frames
+        Records gesture and returns a gesture only if it appears consistently in recent frames
         """
-        if len(self.gesture_history) < self.gesture_confidence_threshold:
-            return None
-        
-        # Count occurrences of each gesture in recent history
-        recent_gestures = list(self.gesture_history)
-        gesture_counts = {}
-        
-        for gesture in recent_gestures:
-            if gesture:
-                gesture_counts[gesture] = gesture_counts.get(gesture, 0) + 1
-        
-        # Return gesture if it appears enough times
-        for gesture, count in gesture_counts.items():
-            if count >= self.gesture_confidence_threshold:
-                return gesture
+        # deque.append silently drops the oldest entry, so uncount it first
+        if len(self.gesture_history) == self.gesture_history.maxlen:
+            evicted = self.gesture_history[0]
+            if evicted:
+                self._counts[evicted] -= 1
+                if (evicted == self._smoothed_gesture and
+                        self._counts[evicted] < self.gesture_confidence_threshold):
+                    self._smoothed_gesture = None
+        
+        self.gesture_history.append(gesture)
+        if gesture:
+            self._counts[gesture] += 1
+            if self._counts[gesture] >= self.gesture_confidence_threshold:
+                self._smoothed_gesture = gesture
         
-        return None
+        return self._smoothed_gesture
+    
+    def _clear_gesture_history(self):
+        """Reset temporal smoothing state"""
+        self.gesture_history.clear()
+        self._counts.clear()
+        self._smoothed_gesture = None
     
     def _classify_gesture(self, landmarks: np.ndarray) -> Optional[str]:
         """
         Classify gesture based on hand landmarks
         Returns direction-based gestures for snake control
         """
-        # Get finger tip and joint positions
-        thumb_tip = landmarks[4]
-        thumb_ip = landmarks[3]
-        thumb_mcp = landmarks[2]
-        index_tip = landmarks[8]
-        index_pip = landmarks[6]
-        index_mcp = landmarks[5]
-        middle_tip = landmarks[12]
-        middle_pip = landmarks[10]
-        ring_tip = landmarks[16]
-        ring_pip = landmarks[14]
-        pinky_tip = landmarks[20]
-        pinky_pip = landmarks[18]
-        wrist = landmarks[0]
-        
-        # Check if fingers are extended with improved thresholds
-        # Use a small tolerance to account for slight variations
-        tolerance = 0.02
-        index_extended = index_tip[1] < index_pip[1] - tolerance
-        middle_extended = middle_tip[1] < middle_pip[1] - tolerance
-        ring_extended = ring_tip[1] < ring_pip[1] - tolerance
-        pinky_extended = pinky_tip[1] < pinky_pip[1] - tolerance
-        
-        # Improved thumb detection - check if thumb is extended outward
-        # For right hand: thumb tip should be to the right of thumb IP
-        # For left hand: thumb tip should be to the left of thumb IP
-        # Use wrist position to determine hand side
-        hand_side = "right" if thumb_mcp[0] < wrist[0] else "left"
-        if hand_side == "right":
-            thumb_extended = thumb_tip[0] > thumb_ip[0] + tolerance
-        else:
-            thumb_extended = thumb_tip[0] < thumb_ip[0] - tolerance
-        
-        # Point gestures: Only index finger extended, others closed
-        if (index_extended and 
-            not middle_extended and 
-            not ring_extended and 
-            not pinky_extended):
-            
-            # Calculate relative position of index tip to wrist
-            dx = index_tip[0] - wrist[0]  # Horizontal offset
-            dy = index_tip[1] - wrist[1]  # Vertical offset (positive = down)
-            
-            # Use improved thresholds with angle-based detection
-            # Require clear directional bias (at least 0.08 difference)
-            threshold = 0.08
-            
-            # Check if pointing in a clear direction (dominant axis)
-            abs_dx = abs(dx)
-            abs_dy = abs(dy)
-            
-            # Point Up: index tip significantly above wrist
-            if abs_dy > abs_dx * 1.2 and dy < -threshold:
-                return "point_up"
-            
-            # Point Down: index tip significantly below wrist
-            elif abs_dy > abs_dx * 1.2 and dy > threshold:
-                return "point_down"
-            
-            # Point Left: index tip significantly to the left of wrist
-            elif abs_dx > abs_dy * 1.2 and dx < -threshold:
-                return "point_left"
-            
-            # Point Right: index tip significantly to the right of wrist
-            elif abs_dx > abs_dy * 1.2 and dx > threshold:
-                return "point_right"
-        
-        # Thumbs Up: Thumb extended up, others closed
-        # Check vertical position relative to thumb IP joint
-        thumb_vertical_diff = thumb_ip[1] - thumb_tip[1]  # Positive if thumb is up
-        if (thumb_extended and 
-            thumb_vertical_diff > 0.05 and  # Thumb is clearly above IP joint
-            not index_extended and
-            not middle_extended and
-            not ring_extended and
-            not pinky_extended):
-            return "thumbs_up"
-        
-        # Thumbs Down: Thumb extended down, others closed
-        thumb_vertical_diff_down = thumb_tip[1] - thumb_ip[1]  # Positive if thumb is down
-        if (thumb_extended and 
-            thumb_vertical_diff_down > 0.05 and  # Thumb is clearly below IP joint
-            not index_extended and
-            not middle_extended and
-            not ring_extended and
-            not pinky_extended):
-            return "thumbs_down"
-        
-        # Peace sign (V) - can be used for up
-        if (index_extended and
-            middle_extended and
-            not ring_extended and
-            not pinky_extended):
-            return "peace"
-        
-        # Fist - can be used for down
-        if (not index_extended and
-            not middle_extended and
-            not ring_extended and
-            not pinky_extended):
-            return "fist"
-        
-        return None
+        code = _classify_gesture_kernel(landmarks, CLASSIFY_TOLERANCE, POINT_THRESHOLD)
+        return GESTURE_NAMES[code]
     
-    def draw_landmarks(self, image):
-        """Draw hand landmarks on image for visualization"""
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_image)
+    def draw_landmarks(self, image, results=None):
+        """
+        Draw hand landmarks on image for visualization
+        Uses results from the last detection when none are given (never runs inference)
+        """
+        if results is None:
+            results = self._last_results
         
-        if results.multi_hand_landmarks:
+        if results is not None and results.multi_hand_landmarks:
             for hand_landmarks in results.multi_hand_landmarks:
                 self.mp_drawing.draw_landmarks(
                     image,
@@ -311,18 +516,43 @@ class GestureController:
         if self.cap is None:
             return None
         
-        ret, frame = self.cap.read()
-        if not ret:
-            return None
-        
-        frame = cv2.flip(frame, 1)
-        frame = self.draw_landmarks(frame)
+        # Reuse the frame detect_gesture already processed so landmarks line up
+        with self._detect_lock:
+            if self._last_frame is not None:
+                frame = self._last_frame.copy()
+            else:
+                latest = self._get_latest_frame()
+                if latest is None:
+                    return None
+                frame = self._prepare_frame(latest[0]).copy()
+            frame = self.draw_landmarks(frame, self._last_results)
         return frame
     
     def release(self):
         """Release camera and resources"""
-        if self.cap is not None:
-            self.cap.release()
-        self.hands.close()
+        self._stop.set()
+        
+        # Only free native resources once the thread using them has exited;
+        # a thread stuck in a camera read or inference keeps its resource alive
+        # (the threads are daemons, so they don't block interpreter exit)
+        if self._thread_stopped(self._detect_thread):
+            self._detect_thread = None
+            self.hands.close()
+        else:
+            print("⚠️  Gesture detection thread did not stop - leaving hand tracker open")
+        
+        if self._thread_stopped(self._reader_thread):
+            self._reader_thread = None
+            if self.cap is not None:
+                self.cap.release()
+        else:
+            print("⚠️  Camera thread did not stop - leaving camera open")
         cv2.destroyAllWindows()
-
+    
+    @staticmethod
+    def _thread_stopped(thread: Optional[threading.Thread], timeout: float = 2.0) -> bool:
+        """Wait for a worker thread to exit; returns True if it is no longer running"""
+        if thread is None:
+            return True
+        thread.join(timeout=timeout)
+        return not thread.is_alive()
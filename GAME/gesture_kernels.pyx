@@ -0,0 +1,82 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled landmark math for the gesture controller
+Mirrors _classify_gesture_py and _detect_swipe_py in gesture_controller.py
+Build with: python setup.py build_ext --inplace
+"""
+
+
+cpdef int classify_gesture(float[:, :] lm, float tol, float thr) noexcept nogil:
+    """Classify a (21, 3) float32 landmark array; returns an index into GESTURE_NAMES"""
+    cdef bint index_extended = lm[8, 1] < lm[6, 1] - tol
+    cdef bint middle_extended = lm[12, 1] < lm[10, 1] - tol
+    cdef bint ring_extended = lm[16, 1] < lm[14, 1] - tol
+    cdef bint pinky_extended = lm[20, 1] < lm[18, 1] - tol
+    cdef bint thumb_extended, fingers_closed
+    cdef float dx, dy, abs_dx, abs_dy
+
+    # Use wrist position to determine hand side
+    if lm[2, 0] < lm[0, 0]:
+        thumb_extended = lm[4, 0] > lm[3, 0] + tol
+    else:
+        thumb_extended = lm[4, 0] < lm[3, 0] - tol
+
+    # Point gestures: Only index finger extended, others closed
+    if index_extended and not middle_extended and not ring_extended and not pinky_extended:
+        dx = lm[8, 0] - lm[0, 0]
+        dy = lm[8, 1] - lm[0, 1]
+        abs_dx = dx if dx >= 0 else -dx
+        abs_dy = dy if dy >= 0 else -dy
+
+        if abs_dy > abs_dx * 1.2 and dy < -thr:
+            return 1  # point_up
+        elif abs_dy > abs_dx * 1.2 and dy > thr:
+            return 2  # point_down
+        elif abs_dx > abs_dy * 1.2 and dx < -thr:
+            return 3  # point_left
+        elif abs_dx > abs_dy * 1.2 and dx > thr:
+            return 4  # point_right
+
+    fingers_closed = (not index_extended and not middle_extended and
+                      not ring_extended and not pinky_extended)
+
+    # Thumbs up/down: thumb clearly above/below its IP joint, others closed
+    if thumb_extended and fingers_closed:
+        if lm[3, 1] - lm[4, 1] > 0.05:
+            return 5  # thumbs_up
+        if lm[4, 1] - lm[3, 1] > 0.05:
+            return 6  # thumbs_down
+
+    # Peace sign (V)
+    if index_extended and middle_extended and not ring_extended and not pinky_extended:
+        return 7  # peace
+
+    # Fist
+    if fingers_closed:
+        return 8  # fist
+
+    return 0
+
+
+cpdef int detect_swipe(double dx, double dy, double dt,
+                       double dist_thr_sq, double speed_thr) noexcept nogil:
+    """Classify a hand movement; returns an index into SWIPE_NAMES"""
+    cdef double dist_sq, min_dist, abs_dx, abs_dy
+
+    if dt <= 0:
+        return 0
+
+    # Compare squared distances to avoid a square root per frame
+    dist_sq = dx * dx + dy * dy
+    min_dist = speed_thr * dt
+    if dist_sq < dist_thr_sq or dist_sq < min_dist * min_dist:
+        return 0
+
+    # Movement must be primarily in one direction
+    abs_dx = dx if dx >= 0 else -dx
+    abs_dy = dy if dy >= 0 else -dy
+    if abs_dy > abs_dx * 1.5:  # Vertical swipe (y increases downward)
+        return 1 if dy < 0 else 2
+    elif abs_dx > abs_dy * 1.5:  # Horizontal swipe
+        return 3 if dx < 0 else 4
+    return 0
@@ -58,21 +58,18 @@ def main():
             # Detect gesture
             current_gesture = None
             if use_gestures:
-                try:
-                    current_gesture = gesture_controller.detect_gesture()
-                    
-                    # Apply cooldown to prevent rapid direction changes
-                    current_time = time.time()
-                    if (current_gesture and 
-                        current_gesture != last_gesture and 
-                        current_time - last_gesture_time > gesture_cooldown):
-                        last_gesture = current_gesture
-                        last_gesture_time = current_time
-                    elif current_gesture == last_gesture:
-                        current_gesture = None  # Don't repeat same gesture
-                except Exception as e:
-                    print(f"Gesture detection error: {e}")
-                    current_gesture = None
+                # Detection runs on a background thread - this never blocks
+                current_gesture = gesture_controller.poll_gesture()
+                
+                # Apply cooldown to prevent rapid direction changes
+                current_time = time.monotonic()
+                if (current_gesture and 
+                    current_gesture != last_gesture and 
+                    current_time - last_gesture_time > gesture_cooldown):
+                    last_gesture = current_gesture
+                    last_gesture_time = current_time
+                elif current_gesture == last_gesture:
+                    current_gesture = None  # Don't repeat same gesture
             
             # Run game frame
             running = game.run_frame(current_gesture)
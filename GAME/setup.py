@@ -0,0 +1,12 @@
+"""
+Build the optional compiled gesture kernels (recommended on Raspberry Pi / Jetson)
+Usage: python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="snake-gesture-kernels",
+    ext_modules=cythonize("gesture_kernels.pyx"),
+)
@@ -6,7 +6,7 @@ Control the snake's direction using hand gestures
 import pygame
 import random
 from enum import Enum
-from typing import List, Tuple, Optional
+from typing import Tuple, Optional, Set
 
 
 class Direction(Enum):
@@ -22,6 +22,9 @@ class Snake:
     
     def __init__(self, start_pos: Tuple[int, int], block_size: int):
         self.body = [start_pos]
+        self._body_set = {start_pos}  # Mirrors body for O(1) membership checks
+        self.removed_tail = None  # Cell vacated by the last move, if any
+        self.hit_self = False
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT
         self.block_size = block_size
@@ -34,12 +37,18 @@ class Snake:
         dx, dy = self.direction.value
         new_head = (head_x + dx * self.block_size, head_y + dy * self.block_size)
         
-        self.body.insert(0, new_head)
-        
+        # Remove the tail first so the head may move into the cell it vacates
         if not self.grow:
-            self.body.pop()
+            self.removed_tail = self.body.pop()
+            self._body_set.discard(self.removed_tail)
         else:
+            self.removed_tail = None
             self.grow = False
+        
+        if new_head in self._body_set:
+            self.hit_self = True
+        self.body.insert(0, new_head)
+        self._body_set.add(new_head)
     
     def change_direction(self, new_direction: Direction):
         """Change snake direction (prevent reversing into itself)"""
@@ -63,12 +72,21 @@ class Snake:
             head_y < 0 or head_y >= height):
             return True
         
-        # Self collision
-        if self.body[0] in self.body[1:]:
+        # Self collision (detected in move)
+        if self.hit_self:
             return True
         
         return False
     
+    @property
+    def cells(self) -> Set[Tuple[int, int]]:
+        """Set of cells occupied by the snake"""
+        return self._body_set
+    
+    def occupies(self, pos: Tuple[int, int]) -> bool:
+        """Check if a cell is part of the snake"""
+        return pos in self._body_set
+    
     def eat_food(self, food_pos: Tuple[int, int]) -> bool:
         """Check if snake ate food"""
         if self.body[0] == food_pos:
@@ -84,6 +102,9 @@ class Food:
         self.block_size = block_size
         self.width = width
         self.height = height
+        self._all_cells = frozenset((x, y)
+                                    for x in range(0, width, block_size)
+                                    for y in range(0, height, block_size))
         self.position = self.generate_position()
     
     def generate_position(self) -> Tuple[int, int]:
@@ -92,17 +113,53 @@ class Food:
         y = random.randrange(0, self.height, self.block_size)
         return (x, y)
     
-    def respawn(self, snake_body: List[Tuple[int, int]]):
-        """Respawn food at new location (not on snake)"""
-        while True:
-            self.position = self.generate_position()
-            if self.position not in snake_body:
-                break
+    def respawn(self, snake_cells: Set[Tuple[int, int]]):
+        """Respawn food at new location (not on any of the snake's cells)"""
+        # Short snake: random guesses almost always land on a free cell
+        if len(snake_cells) < len(self._all_cells) // 8:
+            while True:
+                self.position = self.generate_position()
+                if self.position not in snake_cells:
+                    return
+        
+        # Long snake: pick directly from the free cells so the search is bounded
+        free_cells = self._all_cells - snake_cells
+        if free_cells:
+            self.position = random.choice(tuple(free_cells))
 
 
 class SnakeGame:
     """Main Snake Game class"""
     
+    _GESTURE_MAP = {
+        # Swipe gestures (primary)
+        "swipe_up": Direction.UP,
+        "swipe_down": Direction.DOWN,
+        "swipe_left": Direction.LEFT,
+        "swipe_right": Direction.RIGHT,
+        # Pointing gestures (fallback)
+        "point_up": Direction.UP,
+        "point_down": Direction.DOWN,
+        "point_left": Direction.LEFT,
+        "point_right": Direction.RIGHT,
+        # Alternative gestures
+        "thumbs_up": Direction.UP,
+        "thumbs_down": Direction.DOWN,
+        "peace": Direction.UP,  # Peace sign = up
+        "fist": Direction.DOWN,  # Fist = down
+    }
+    
+    _KEY_MAP = {
+        pygame.K_UP: Direction.UP,
+        pygame.K_DOWN: Direction.DOWN,
+        pygame.K_LEFT: Direction.LEFT,
+        pygame.K_RIGHT: Direction.RIGHT,
+        pygame.K_w: Direction.UP,
+        pygame.K_s: Direction.DOWN,
+        pygame.K_a: Direction.LEFT,
+        pygame.K_d: Direction.RIGHT,
+    }
+    
     def __init__(self, width: int = 800, height: int = 600, block_size: int = 20):
         pygame.init()
         
@@ -114,6 +171,11 @@ class SnakeGame:
         self.grid_width = (width // block_size) * block_size
         self.grid_height = (height // block_size) * block_size
         
+        # One reusable Rect per grid cell (cell coordinates never change)
+        self._cell_rects = {(x, y): pygame.Rect(x, y, block_size, block_size)
+                            for x in range(0, self.grid_width, block_size)
+                            for y in range(0, self.grid_height, block_size)}
+        
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Snake Game - Hand Gesture Control")
         
@@ -129,6 +191,15 @@ class SnakeGame:
         self.DARK_GREEN = (0, 200, 0)
         self.BLUE = (0, 0, 255)
         
+        # Rendering state - draw() only repaints what changed since the last frame
+        self._shown_state = None
+        self._shown_cells = ()
+        self._shown_score = None
+        self._score_rect = pygame.Rect(10, 10, 0, 0)
+        self._render_gesture(None)
+        self._instructions_rect = pygame.Rect(self.width - 200, self.height - 120, 200, 120)
+        self._render_static_text()
+        
         self.reset_game()
     
     def reset_game(self):
@@ -136,36 +207,24 @@ class SnakeGame:
         start_pos = (self.grid_width // 2, self.grid_height // 2)
         self.snake = Snake(start_pos, self.block_size)
         self.food = Food(self.block_size, self.grid_width, self.grid_height)
-        self.food.respawn(self.snake.body)
+        self.food.respawn(self.snake.cells)
         self.score = 0
         self.game_over = False
         self.paused = False
+        self._full_redraw = True
+        
+        # Snake body drawn once per segment and patched as it moves
+        self._snake_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self._paint_body_cell(start_pos)
     
     def handle_gesture(self, gesture: Optional[str]):
         """Handle gesture input to change direction"""
         if self.game_over or self.paused:
             return
         
-        gesture_to_direction = {
-            # Swipe gestures (primary)
-            "swipe_up": Direction.UP,
-            "swipe_down": Direction.DOWN,
-            "swipe_left": Direction.LEFT,
-            "swipe_right": Direction.RIGHT,
-            # Pointing gestures (fallback)
-            "point_up": Direction.UP,
-            "point_down": Direction.DOWN,
-            "point_left": Direction.LEFT,
-            "point_right": Direction.RIGHT,
-            # Alternative gestures
-            "thumbs_up": Direction.UP,
-            "thumbs_down": Direction.DOWN,
-            "peace": Direction.UP,  # Peace sign = up
-            "fist": Direction.DOWN,  # Fist = down
-        }
-        
-        if gesture and gesture in gesture_to_direction:
-            self.snake.change_direction(gesture_to_direction[gesture])
+        direction = self._GESTURE_MAP.get(gesture)
+        if direction is not None:
+            self.snake.change_direction(direction)
     
     def handle_keyboard(self, key):
         """Handle keyboard input (for testing/backup)"""
@@ -181,19 +240,9 @@ class SnakeGame:
         if self.paused:
             return
         
-        key_to_direction = {
-            pygame.K_UP: Direction.UP,
-            pygame.K_DOWN: Direction.DOWN,
-            pygame.K_LEFT: Direction.LEFT,
-            pygame.K_RIGHT: Direction.RIGHT,
-            pygame.K_w: Direction.UP,
-            pygame.K_s: Direction.DOWN,
-            pygame.K_a: Direction.LEFT,
-            pygame.K_d: Direction.RIGHT,
-        }
-        
-        if key in key_to_direction:
-            self.snake.change_direction(key_to_direction[key])
+        direction = self._KEY_MAP.get(key)
+        if direction is not None:
+            self.snake.change_direction(direction)
     
     def update(self):
         """Update game state"""
@@ -201,77 +250,176 @@ class SnakeGame:
             return
         
         self.snake.move()
+        self._patch_snake_surface()
         
         # Check food collision
         if self.snake.eat_food(self.food.position):
             self.score += 10
-            self.food.respawn(self.snake.body)
+            self.food.respawn(self.snake.cells)
         
         # Check game over
         if self.snake.check_collision(self.grid_width, self.grid_height):
             self.game_over = True
     
     def draw(self, current_gesture: Optional[str] = None):
-        """Draw game elements"""
+        """Draw game elements, updating only the parts of the screen that changed"""
+        overlays = []  # Text regions that need repainting
+        
+        if self.score != self._shown_score:
+            old_rect = self._score_rect
+            self._render_score()
+            overlays.append(old_rect.union(self._score_rect))
+        
+        if current_gesture != self._shown_gesture:
+            old_rect = self._gesture_rect
+            self._render_gesture(current_gesture)
+            overlays.append(old_rect.union(self._gesture_rect))
+        
+        # Game state changes alter most of the screen, so redraw it all
+        state = (self.game_over, self.paused)
+        if self._full_redraw or state != self._shown_state:
+            self._draw_scene()
+            pygame.display.flip()
+            self._full_redraw = False
+            self._shown_state = state
+            self._shown_cells = self._tracked_cells()
+            return
+        
+        dirty = []
+        if not self.game_over and not self.paused:
+            # Snake moves one cell per frame, so only its ends and the food can change
+            cells = self._tracked_cells()
+            for pos in set(self._shown_cells + cells):
+                rect = self._draw_cell(pos)
+                dirty.append(rect)
+                for overlay in (self._score_rect, self._gesture_rect, self._instructions_rect):
+                    if overlay.colliderect(rect) and overlay not in overlays:
+                        overlays.append(overlay)
+            self._shown_cells = cells
+        
+        # Repaint text regions (and anything under them) clipped to their area
+        for region in overlays:
+            self.screen.set_clip(region)
+            self._draw_scene()
+            self.screen.set_clip(None)
+            dirty.append(region)
+        
+        if dirty:
+            pygame.display.update(dirty)
+    
+    def _cell_rect(self, pos: Tuple[int, int]) -> pygame.Rect:
+        """Get the Rect for a grid cell (the head can be off-grid after hitting a wall)"""
+        rect = self._cell_rects.get(pos)
+        if rect is None:
+            rect = pygame.Rect(pos[0], pos[1], self.block_size, self.block_size)
+        return rect
+    
+    def _paint_body_cell(self, pos: Tuple[int, int]):
+        """Draw one body segment onto the snake surface"""
+        rect = self._cell_rect(pos)
+        pygame.draw.rect(self._snake_surface, self.DARK_GREEN, rect)
+        pygame.draw.rect(self._snake_surface, self.BLACK, rect, 1)
+    
+    def _patch_snake_surface(self):
+        """Update the snake surface after a move: clear the vacated tail, add the new head"""
+        tail = self.snake.removed_tail
+        if tail is not None and not self.snake.occupies(tail):
+            self._snake_surface.fill((0, 0, 0, 0), self._cell_rect(tail))
+        self._paint_body_cell(self.snake.body[0])
+    
+    def _tracked_cells(self) -> Tuple[Tuple[int, int], ...]:
+        """Cells that can change between frames: snake head, snake tail and food"""
+        return (self.snake.body[0], self.snake.body[-1], self.food.position)
+    
+    def _draw_cell(self, pos: Tuple[int, int]) -> pygame.Rect:
+        """Repaint a single grid cell from the current game state"""
+        rect = self._cell_rect(pos)
+        if self.snake.occupies(pos):
+            color = self.GREEN if pos == self.snake.body[0] else self.DARK_GREEN
+            pygame.draw.rect(self.screen, color, rect)
+            pygame.draw.rect(self.screen, self.BLACK, rect, 1)
+        elif pos == self.food.position:
+            pygame.draw.rect(self.screen, self.RED, rect)
+        else:
+            self.screen.fill(self.BLACK, rect)
+        return rect
+    
+    def _render_static_text(self):
+        """Render text that never changes once, at startup"""
+        self._game_over_surface = self.font.render("GAME OVER", True, self.RED)
+        self._game_over_rect = self._game_over_surface.get_rect(
+            center=(self.width // 2, self.height // 2 - 30))
+        self._restart_surface = self.small_font.render(
+            "Press R to restart or show 'thumbs_up' gesture", True, self.WHITE)
+        self._restart_rect = self._restart_surface.get_rect(
+            center=(self.width // 2, self.height // 2 + 10))
+        
+        self._pause_surface = self.font.render("PAUSED", True, self.WHITE)
+        self._pause_rect = self._pause_surface.get_rect(center=(self.width // 2, self.height // 2))
+        
+        instructions = [
+            "Controls:",
+            "Point Up = Move Up",
+            "Point Down = Move Down",
+            "Point Left = Move Left",
+            "Point Right = Move Right",
+            "P = Pause"
+        ]
+        self._instructions_surface = pygame.Surface(self._instructions_rect.size, pygame.SRCALPHA)
+        for i, instruction in enumerate(instructions):
+            text = self.small_font.render(instruction, True, self.WHITE)
+            self._instructions_surface.blit(text, (0, i * 20))
+    
+    def _render_score(self):
+        """Render the score text (only when the score changes)"""
+        self._score_surface = self.font.render(f"Score: {self.score}", True, self.WHITE)
+        self._score_rect = self._score_surface.get_rect(topleft=(10, 10))
+        self._shown_score = self.score
+    
+    def _render_gesture(self, gesture: Optional[str]):
+        """Render the gesture info text (only when the gesture changes)"""
+        if gesture:
+            self._gesture_surface = self.small_font.render(
+                f"Gesture: {gesture}", True, self.BLUE)
+            self._gesture_rect = self._gesture_surface.get_rect(topleft=(10, 50))
+        else:
+            self._gesture_surface = None
+            self._gesture_rect = pygame.Rect(10, 50, 0, 0)
+        self._shown_gesture = gesture
+    
+    def _draw_scene(self):
+        """Draw the whole game screen (respects the screen clip area)"""
         self.screen.fill(self.BLACK)
         
         if not self.game_over and not self.paused:
             # Draw food
-            pygame.draw.rect(self.screen, self.RED, 
-                           (*self.food.position, self.block_size, self.block_size))
+            pygame.draw.rect(self.screen, self.RED, self._cell_rect(self.food.position))
             
-            # Draw snake
-            for i, segment in enumerate(self.snake.body):
-                color = self.GREEN if i == 0 else self.DARK_GREEN
-                pygame.draw.rect(self.screen, color,
-                               (*segment, self.block_size, self.block_size))
-                pygame.draw.rect(self.screen, self.BLACK,
-                               (*segment, self.block_size, self.block_size), 1)
+            # Draw snake body in one blit, then the head on top
+            self.screen.blit(self._snake_surface, (0, 0))
+            head = self._cell_rect(self.snake.body[0])
+            pygame.draw.rect(self.screen, self.GREEN, head)
+            pygame.draw.rect(self.screen, self.BLACK, head, 1)
         
         # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, self.WHITE)
-        self.screen.blit(score_text, (10, 10))
+        self.screen.blit(self._score_surface, self._score_rect)
         
         # Draw gesture info
-        if current_gesture:
-            gesture_text = self.small_font.render(
-                f"Gesture: {current_gesture}", True, self.BLUE)
-            self.screen.blit(gesture_text, (10, 50))
+        if self._gesture_surface:
+            self.screen.blit(self._gesture_surface, self._gesture_rect)
         
         # Draw game over screen
         if self.game_over:
-            game_over_text = self.font.render("GAME OVER", True, self.RED)
-            restart_text = self.small_font.render(
-                "Press R to restart or show 'thumbs_up' gesture", True, self.WHITE)
-            
-            text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 30))
-            restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2 + 10))
-            
-            self.screen.blit(game_over_text, text_rect)
-            self.screen.blit(restart_text, restart_rect)
+            self.screen.blit(self._game_over_surface, self._game_over_rect)
+            self.screen.blit(self._restart_surface, self._restart_rect)
         
         # Draw pause screen
         if self.paused:
-            pause_text = self.font.render("PAUSED", True, self.WHITE)
-            text_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2))
-            self.screen.blit(pause_text, text_rect)
+            self.screen.blit(self._pause_surface, self._pause_rect)
         
         # Draw instructions
         if not self.game_over:
-            instructions = [
-                "Controls:",
-                "Point Up = Move Up",
-                "Point Down = Move Down",
-                "Point Left = Move Left",
-                "Point Right = Move Right",
-                "P = Pause"
-            ]
-            y_offset = self.height - 120
-            for i, instruction in enumerate(instructions):
-                text = self.small_font.render(instruction, True, self.WHITE)
-                self.screen.blit(text, (self.width - 200, y_offset + i * 20))
-        
-        pygame.display.flip()
+            self.screen.blit(self._instructions_surface, self._instructions_rect)
     
     def run_frame(self, gesture: Optional[str] = None):
         """Run one frame of the game"""
@@ -281,6 +429,10 @@ class SnakeGame:
                 return False
             elif event.type == pygame.KEYDOWN:
                 self.handle_keyboard(event.key)
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                                pygame.WINDOWRESTORED):
+                # Window contents were lost - dirty-rect updates alone won't restore them
+                self._full_redraw = True
         
         # Handle gesture input
         self.handle_gesture(gesture)